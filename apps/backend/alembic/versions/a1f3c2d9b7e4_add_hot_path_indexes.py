@@ -0,0 +1,27 @@
+"""Add indexes for hot list/filter queries
+
+Revision ID: a1f3c2d9b7e4
+Revises:
+Create Date: 2026-08-29 10:15:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "a1f3c2d9b7e4"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_timeslot_active_start", "time_slots", ["is_active", "start_time"])
+    op.create_index("ix_booking_date", "bookings", ["booking_date"])
+    op.create_index("ix_booking_date_user", "bookings", ["booking_date", "user_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_booking_date_user", table_name="bookings")
+    op.drop_index("ix_booking_date", table_name="bookings")
+    op.drop_index("ix_timeslot_active_start", table_name="time_slots")
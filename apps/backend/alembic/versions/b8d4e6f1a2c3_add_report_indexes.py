@@ -0,0 +1,25 @@
+"""Add indexes for report and dashboard aggregates
+
+Revision ID: b8d4e6f1a2c3
+Revises: a1f3c2d9b7e4
+Create Date: 2026-08-29 11:40:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "b8d4e6f1a2c3"
+down_revision = "a1f3c2d9b7e4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_bookings_date_status", "bookings", ["booking_date", "status"])
+    op.create_index("ix_bookings_source", "bookings", ["source"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_bookings_source", table_name="bookings")
+    op.drop_index("ix_bookings_date_status", table_name="bookings")
@@ -0,0 +1,27 @@
+"""Add composite index for availability overlap checks
+
+Revision ID: c5a7b3d8e9f0
+Revises: b8d4e6f1a2c3
+Create Date: 2026-08-29 13:05:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "c5a7b3d8e9f0"
+down_revision = "b8d4e6f1a2c3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_booking_overlap",
+        "bookings",
+        ["booking_date", "table_number", "status", "start_time", "end_time"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_booking_overlap", table_name="bookings")
@@ -0,0 +1,30 @@
+"""Add partial unique index preventing double bookings
+
+Revision ID: d2e9f4a6b1c8
+Revises: c5a7b3d8e9f0
+Create Date: 2026-08-29 14:20:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "d2e9f4a6b1c8"
+down_revision = "c5a7b3d8e9f0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ux_booking_slot",
+        "bookings",
+        ["table_number", "booking_date", "start_time"],
+        unique=True,
+        postgresql_where=sa.text("status = 'confirmed'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ux_booking_slot", table_name="bookings")
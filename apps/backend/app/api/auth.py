@@ -1,9 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta
 from ..database import get_db
-from ..auth import authenticate_user, create_access_token, get_current_active_user, get_password_hash
+from ..auth import authenticate_user, create_access_token, get_current_active_user, get_password_hash_async
 from ..models import User
 from ..schemas import Token, UserCreate, User as UserSchema
 from ..config import settings
@@ -13,10 +13,10 @@ router = APIRouter(tags=["authentication"])
 @router.post("/token", response_model=Token)
 async def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Login endpoint to get access token."""
-    user = authenticate_user(db, form_data.username, form_data.password)
+    user = await authenticate_user(db, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -34,12 +34,12 @@ async def login_for_access_token(
 @router.post("/register", response_model=UserSchema)
 async def register_user(
     user_data: UserCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Register a new user."""
     # Check if username already exists
     from sqlalchemy import select
-    result = db.execute(select(User).where(User.username == user_data.username))
+    result = await db.execute(select(User).where(User.username == user_data.username))
     existing_user = result.scalar_one_or_none()
     
     if existing_user:
@@ -49,7 +49,7 @@ async def register_user(
         )
     
     # Check if email already exists
-    result = db.execute(select(User).where(User.email == user_data.email))
+    result = await db.execute(select(User).where(User.email == user_data.email))
     existing_email = result.scalar_one_or_none()
     
     if existing_email:
@@ -59,7 +59,7 @@ async def register_user(
         )
     
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await get_password_hash_async(user_data.password)
     db_user = User(
         username=user_data.username,
         email=user_data.email,
@@ -70,8 +70,8 @@ async def register_user(
     )
     
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     
     return db_user
 
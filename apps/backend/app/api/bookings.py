@@ -1,5 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import date
 from typing import List
 from ..database import get_db
@@ -7,266 +9,223 @@ from ..auth import get_current_active_user
 from ..models import User
 from ..schemas import TableListResponse, BookingCreate, BookingResponse, Booking as BookingSchema, TimeSlot as TimeSlotSchema
 from ..services.booking_service import BookingService
-from ..models import TimeSlot as TimeSlotModel
+from ..services.admin_service import AdminService
+from ..tasks import delete_old_bookings
 
 router = APIRouter(tags=["bookings"])
 booking_service = BookingService()
+admin_service = AdminService()
+
+# Serialize booking lists with one C-accelerated TypeAdapter pass instead of
+# FastAPI's per-item response_model validation, which is the dominant cost on
+# the large list endpoints.
+_booking_list_adapter = TypeAdapter(List[BookingSchema])
+
+def _booking_list_response(bookings) -> ORJSONResponse:
+    validated = _booking_list_adapter.validate_python(bookings, from_attributes=True)
+    return ORJSONResponse(_booking_list_adapter.dump_python(validated, mode="json"))
+
+# Unexpected errors propagate to the global Exception handler in main.py;
+# routes only raise HTTPException for expected 4xx outcomes.
 
 @router.get("/tables", response_model=TableListResponse)
 async def get_table_availability(
     target_date: date,
     time_slot: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Get table availability for a specific date and time slot."""
-    try:
-        tables = booking_service.get_table_availability(db, target_date, time_slot)
-        return TableListResponse(
-            tables=tables,
-            date=target_date,
-            time_slot=time_slot
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error retrieving table availability: {str(e)}"
-        )
+    tables = await booking_service.get_table_availability(db, target_date, time_slot)
+    return TableListResponse(
+        tables=tables,
+        date=target_date,
+        time_slot=time_slot
+    )
+
+@router.get("/tables/day")
+async def get_table_availability_for_day(
+    target_date: date,
+    db: AsyncSession = Depends(get_db)
+):
+    """Get table availability for every active time slot on a date."""
+    slots = await admin_service.get_all_time_slots(db)
+    slot_keys = [f"{slot.start_time}-{slot.end_time}" for slot in slots]
+    availability = await booking_service.get_table_availability_for_day(db, target_date, slot_keys)
+    return {"date": target_date.isoformat(), "slots": availability}
 
 @router.get("/time-slots", response_model=List[TimeSlotSchema])
 async def get_public_time_slots(
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Public endpoint to fetch active time slots ordered by start time."""
-    try:
-        return db.query(TimeSlotModel).filter(TimeSlotModel.is_active == True).order_by(TimeSlotModel.start_time).all()
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error retrieving time slots: {str(e)}"
-        )
+    return await admin_service.get_all_time_slots(db)
 
 @router.post("/", response_model=BookingResponse)
 async def create_booking(
     booking_data: BookingCreate,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a new table booking."""
-    try:
-        # Convert date to datetime for the service
-        from datetime import datetime
-        booking_date = datetime.combine(booking_data.booking_date, datetime.min.time())
-        
-        # Create booking data for service
-        service_booking_data = BookingCreate(
-            table_number=booking_data.table_number,
-            booking_date=booking_date,
-            start_time=booking_data.start_time,
-            end_time=booking_data.end_time,
-            guest_name=booking_data.guest_name,
-            guest_phone=booking_data.guest_phone,
-            number_of_people=booking_data.number_of_people,
-            special_occasion=booking_data.special_occasion
-        )
-        
-        booking = booking_service.create_booking(db, service_booking_data, current_user.id)
-        
-        if not booking:
-            return BookingResponse(
-                success=False,
-                message="Table is not available for the selected time slot"
-            )
-        
+    # Convert date to datetime for the service
+    from datetime import datetime
+    booking_date = datetime.combine(booking_data.booking_date, datetime.min.time())
+
+    # Create booking data for service
+    service_booking_data = BookingCreate(
+        table_number=booking_data.table_number,
+        booking_date=booking_date,
+        start_time=booking_data.start_time,
+        end_time=booking_data.end_time,
+        guest_name=booking_data.guest_name,
+        guest_phone=booking_data.guest_phone,
+        number_of_people=booking_data.number_of_people,
+        special_occasion=booking_data.special_occasion
+    )
+
+    booking = await booking_service.create_booking(db, service_booking_data, current_user.id)
+
+    if not booking:
         return BookingResponse(
-            success=True,
-            message="Booking created successfully",
-            booking=booking
-        )
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error creating booking: {str(e)}"
+            success=False,
+            message="Table is not available for the selected time slot"
         )
 
-@router.get("/all", response_model=List[BookingSchema])
+    return BookingResponse(
+        success=True,
+        message="Booking created successfully",
+        booking=booking
+    )
+
+@router.get("/all", response_model=None)
 async def get_all_bookings(
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Get all bookings (visible to any authenticated user)."""
-    try:
-        return booking_service.get_all_bookings(db)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error retrieving bookings: {str(e)}"
-        )
+    return _booking_list_response(await booking_service.get_all_bookings(db))
 
-@router.delete("/yesterday")
+@router.delete("/yesterday", status_code=status.HTTP_202_ACCEPTED)
 async def delete_yesterday_bookings(
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_active_user)
 ):
-    """Delete all bookings from yesterday (admin only)."""
-    try:
-        # Check if user is admin
-        if current_user.role != "admin":
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Only administrators can delete bookings"
-            )
-        
-        deleted_count = booking_service.delete_yesterday_bookings(db)
-        
-        return {
-            "success": True,
-            "message": f"Successfully deleted {deleted_count} bookings from yesterday",
-            "deleted_count": deleted_count
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
+    """Queue deletion of all bookings from yesterday (admin only)."""
+    # Check if user is admin
+    if current_user.role != "admin":
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error deleting yesterday's bookings: {str(e)}"
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only administrators can delete bookings"
         )
 
-@router.get("/my-bookings", response_model=List[BookingSchema])
+    task = delete_old_bookings.delay()
+
+    return {
+        "success": True,
+        "message": "Cleanup of yesterday's bookings scheduled",
+        "job_id": task.id
+    }
+
+@router.get("/my-bookings", response_model=None)
 async def get_my_bookings(
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Get all bookings for the current user."""
-    try:
-        return booking_service.get_user_bookings(db, current_user.id)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error retrieving bookings: {str(e)}"
-        )
+    return _booking_list_response(await booking_service.get_user_bookings(db, current_user.id))
 
 @router.get("/{booking_id}", response_model=BookingSchema)
 async def get_booking(
     booking_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Get a specific booking by ID."""
-    try:
-        booking = booking_service.get_booking_by_id(db, booking_id)
-        if not booking:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Booking not found"
-            )
-        
-        # Check if user owns this booking or is admin
-        if booking.user_id != current_user.id and current_user.role != "admin":
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to view this booking"
-            )
-        
-        return booking
-        
-    except HTTPException:
-        raise
-    except Exception as e:
+    booking = await booking_service.get_booking_by_id(db, booking_id)
+    if not booking:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Booking not found"
+        )
+
+    # Check if user owns this booking or is admin
+    if booking.user_id != current_user.id and current_user.role != "admin":
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error retrieving booking: {str(e)}"
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to view this booking"
         )
 
+    return booking
+
 @router.put("/{booking_id}", response_model=BookingResponse)
 async def update_booking(
     booking_id: int,
     booking_data: dict,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update an existing booking."""
-    try:
-        # Get the booking first
-        booking = booking_service.get_booking_by_id(db, booking_id)
-        if not booking:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Booking not found"
-            )
-        
-        # Check if user owns this booking or is admin
-        if booking.user_id != current_user.id and current_user.role != "admin":
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to modify this booking"
-            )
-        
-        # Update the booking
-        updated_booking = booking_service.update_booking(db, booking_id, booking_data)
-        
-        if not updated_booking:
-            return BookingResponse(
-                success=False,
-                message="Failed to update booking"
-            )
-        
-        return BookingResponse(
-            success=True,
-            message="Booking updated successfully",
-            booking=updated_booking
+    # Get the booking first
+    booking = await booking_service.get_booking_by_id(db, booking_id)
+    if not booking:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Booking not found"
         )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
+
+    # Check if user owns this booking or is admin
+    if booking.user_id != current_user.id and current_user.role != "admin":
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error updating booking: {str(e)}"
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to modify this booking"
         )
 
+    # Update the booking
+    updated_booking = await booking_service.update_booking(db, booking_id, booking_data)
+
+    if not updated_booking:
+        return BookingResponse(
+            success=False,
+            message="Failed to update booking"
+        )
+
+    return BookingResponse(
+        success=True,
+        message="Booking updated successfully",
+        booking=updated_booking
+    )
+
 @router.delete("/{booking_id}", response_model=BookingResponse)
 async def cancel_booking(
     booking_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Cancel a booking."""
-    try:
-        # Get the booking first
-        booking = booking_service.get_booking_by_id(db, booking_id)
-        if not booking:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Booking not found"
-            )
-        
-        # Check if user owns this booking or is admin
-        if booking.user_id != current_user.id and current_user.role != "admin":
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to cancel this booking"
-            )
-        
-        # Cancel the booking
-        success = booking_service.cancel_booking(db, booking_id)
-        
-        if not success:
-            return BookingResponse(
-                success=False,
-                message="Failed to cancel booking"
-            )
-        
-        return BookingResponse(
-            success=True,
-            message="Booking cancelled successfully"
+    # Get the booking first
+    booking = await booking_service.get_booking_by_id(db, booking_id)
+    if not booking:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Booking not found"
         )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
+
+    # Check if user owns this booking or is admin
+    if booking.user_id != current_user.id and current_user.role != "admin":
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error cancelling booking: {str(e)}"
-        )
\ No newline at end of file
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to cancel this booking"
+        )
+
+    # Cancel the booking
+    success = await booking_service.cancel_booking(db, booking_id)
+
+    if not success:
+        return BookingResponse(
+            success=False,
+            message="Failed to cancel booking"
+        )
+
+    return BookingResponse(
+        success=True,
+        message="Booking cancelled successfully"
+    )
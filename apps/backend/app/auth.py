@@ -1,10 +1,12 @@
 from datetime import datetime, timedelta
 from typing import Optional
+import time
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from .database import get_db
 from .models import User
@@ -16,6 +18,17 @@ pwd_context = CryptContext(schemes=["bcrypt", "sha256_crypt"], deprecated="auto"
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/token")
 
+# Short-lived per-token cache of resolved users. The JWT signature and expiry
+# are still verified on every request; only the user-row SELECT is skipped,
+# which otherwise runs once per authenticated call.
+_USER_CACHE_TTL = 60  # seconds
+_USER_CACHE_MAX = 10000
+_user_cache: dict = {}  # token -> (User, expires_at)
+
+def invalidate_user_cache():
+    """Drop all cached token->user entries (e.g. after user mutations)."""
+    _user_cache.clear()
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
     try:
@@ -28,6 +41,11 @@ def get_password_hash(password: str) -> str:
     """Generate password hash."""
     return pwd_context.hash(password)
 
+async def get_password_hash_async(password: str) -> str:
+    """Hash on a worker thread; bcrypt is ~100ms of pure CPU that would
+    otherwise stall the event loop for every concurrent request."""
+    return await run_in_threadpool(get_password_hash, password)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create JWT access token."""
     to_encode = data.copy()
@@ -51,24 +69,32 @@ def verify_token(token: str) -> Optional[str]:
     except JWTError:
         return None
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)):
     """Get current authenticated user."""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    
+
     username = verify_token(token)
     if username is None:
         raise credentials_exception
-    
-    result = db.execute(select(User).where(User.username == username))
+
+    cached = _user_cache.get(token)
+    if cached and cached[1] > time.monotonic():
+        return cached[0]
+
+    result = await db.execute(select(User).where(User.username == username))
     user = result.scalar_one_or_none()
-    
+
     if user is None:
         raise credentials_exception
-    
+
+    if len(_user_cache) >= _USER_CACHE_MAX:
+        _user_cache.clear()
+    _user_cache[token] = (user, time.monotonic() + _USER_CACHE_TTL)
+
     return user
 
 def get_current_active_user(current_user: User = Depends(get_current_user)):
@@ -86,13 +112,14 @@ def get_current_admin_user(current_user: User = Depends(get_current_user)):
         )
     return current_user
 
-def authenticate_user(db: Session, username: str, password: str):
+async def authenticate_user(db: AsyncSession, username: str, password: str):
     """Authenticate user with username and password."""
-    result = db.execute(select(User).where(User.username == username))
+    result = await db.execute(select(User).where(User.username == username))
     user = result.scalar_one_or_none()
     
     if not user:
         return False
-    if not verify_password(password, user.hashed_password):
+    # Verification is as CPU-bound as hashing; keep it off the event loop too
+    if not await run_in_threadpool(verify_password, password, user.hashed_password):
         return False
     return user
@@ -1,34 +1,100 @@
-from fastapi import FastAPI, Depends, HTTPException, status
+from fastapi import FastAPI, Depends, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, PlainTextResponse
 from fastapi.security import HTTPBearer
-from sqlalchemy.orm import Session
-from datetime import datetime
-import uvicorn
+from contextlib import asynccontextmanager
+import logging
 
-from app.database import get_db
+from app.config import settings
+from app.database import get_db, AsyncSessionLocal
 from app.api import auth, admin, bookings
 from app.models import User
 from app.auth import get_current_active_user
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm the read-mostly config caches (restaurant settings, time slots,
+    # operating hours) so the first requests never pay the cold DB hit. The
+    # update endpoints invalidate/refresh these.
+    try:
+        async with AsyncSessionLocal() as db:
+            await admin.admin_service.get_restaurant_settings(db)
+            await admin.admin_service.get_all_time_slots(db)
+            await admin.admin_service.get_operating_hours(db)
+    except Exception:
+        # DB not reachable yet; the endpoints fall back to lazy loads.
+        pass
+    yield
+
 app = FastAPI(
     title="Table Booking API",
     description="API for restaurant table booking system",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-# CORS middleware
+# CORS middleware - explicit lists keep preflight checks cheap, and wildcard
+# origins are invalid alongside allow_credentials anyway
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure this properly for production
+    allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=86400,  # let browsers cache preflight responses for a day
 )
 
-# Health check endpoint for AWS
-@app.get("/health")
+# Single catch-all error handler instead of per-route try/except blocks:
+# routes stay on FastAPI's fast path and we never leak str(exc) to clients.
+logger = logging.getLogger("app")
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    logger.exception("Unhandled error on %s %s", request.method, request.url.path)
+    return JSONResponse(
+        status_code=500,
+        content={"detail": "Internal server error"},
+    )
+
+# Development-only query audit: list endpoints that lazy-load relationships
+# explode into one SELECT per row, which only shows up under real data.
+# Count statements per request and warn when an endpoint looks N+1-ish.
+if settings.DEBUG:
+    from contextvars import ContextVar
+    from sqlalchemy import event
+    from app.database import engine
+
+    # The holder is mutable on purpose: call_next runs in a task with a
+    # *copied* context, so a plain int ContextVar set by the listener would
+    # be invisible here. Mutating the shared dict crosses the copy.
+    _query_count: ContextVar[dict] = ContextVar("query_count")
+    _query_logger = logging.getLogger("app.queryaudit")
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _count_query(conn, cursor, statement, parameters, context, executemany):
+        holder = _query_count.get(None)
+        if holder is not None:
+            holder["n"] += 1
+
+    @app.middleware("http")
+    async def audit_query_count(request, call_next):
+        holder = {"n": 0}
+        _query_count.set(holder)
+        response = await call_next(request)
+        count = holder["n"]
+        if count > 10:
+            _query_logger.warning(
+                "%s %s issued %d queries (possible N+1 lazy loading)",
+                request.method, request.url.path, count
+            )
+        return response
+
+# Health check endpoint for AWS; probes hit this constantly, so return a
+# constant body with no datetime allocation or JSON encoding
+@app.get("/health", response_class=PlainTextResponse)
 async def health_check():
-    return {"status": "healthy", "timestamp": datetime.utcnow()}
+    return "ok"
 
 # Include routers
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["auth"])
@@ -39,6 +105,3 @@ app.include_router(bookings.router, prefix="/api/v1/bookings", tags=["bookings"]
 @app.get("/")
 async def root():
     return {"message": "Table Booking API", "version": "1.0.0"}
-
-if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
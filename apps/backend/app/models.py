@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, Float, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, Float, JSON, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from .database import Base
@@ -50,7 +50,11 @@ class Table(Base):
 
 class TimeSlot(Base):
     __tablename__ = "time_slots"
-    
+    __table_args__ = (
+        # Public listing filters on is_active and orders by start_time
+        Index("ix_timeslot_active_start", "is_active", "start_time"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     start_time = Column(String)  # Format: "HH:MM"
     end_time = Column(String)    # Format: "HH:MM"
@@ -70,7 +74,26 @@ class OperatingHours(Base):
 
 class Booking(Base):
     __tablename__ = "bookings"
-    
+    __table_args__ = (
+        # Availability and report queries filter by booking_date; my-bookings
+        # filters by user_id within a date range
+        Index("ix_booking_date", "booking_date"),
+        Index("ix_booking_date_user", "booking_date", "user_id"),
+        # Dashboard and report aggregates filter on (booking_date, status)
+        # and group reports by source
+        Index("ix_bookings_date_status", "booking_date", "status"),
+        Index("ix_bookings_source", "source"),
+        # Availability overlap checks filter on exactly these columns
+        Index("ix_booking_overlap", "booking_date", "table_number", "status", "start_time", "end_time"),
+        # The database, not a Redis lock, is the authority on double-booking:
+        # two concurrent inserts for the same confirmed slot cannot both land
+        Index(
+            "ux_booking_slot", "table_number", "booking_date", "start_time",
+            unique=True,
+            postgresql_where=text("status = 'confirmed'"),
+        ),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
     table_number = Column(String, ForeignKey("tables.table_number"))
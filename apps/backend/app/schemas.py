@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 from typing import Optional, List
 from datetime import datetime, date, time
 
@@ -12,8 +12,7 @@ class RestaurantSettings(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class RestaurantSettingsUpdate(BaseModel):
     restaurant_name: Optional[str] = None
@@ -44,8 +43,7 @@ class User(UserBase):
     is_active: bool
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Table schemas
 class TableBase(BaseModel):
@@ -71,8 +69,7 @@ class Table(TableBase):
     is_active: bool
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Time slot schemas
 class TimeSlotBase(BaseModel):
@@ -88,8 +85,7 @@ class TimeSlot(TimeSlotBase):
     is_active: bool
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Operating hours schemas
 class OperatingHoursBase(BaseModel):
@@ -101,12 +97,16 @@ class OperatingHoursBase(BaseModel):
 class OperatingHoursCreate(OperatingHoursBase):
     pass
 
+class OperatingHoursUpdate(BaseModel):
+    opening_time: str
+    closing_time: str
+    is_open: bool
+
 class OperatingHours(OperatingHoursBase):
     id: int
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Booking schemas
 class BookingBase(BaseModel):
@@ -138,8 +138,7 @@ class Booking(BookingBase):
     updated_at: datetime
     # Removed table relationship to avoid validation issues
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Table block schemas
 class TableBlockBase(BaseModel):
@@ -156,8 +155,7 @@ class TableBlock(TableBlockBase):
     created_by: int
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Room layout schemas
 class RoomLayoutBase(BaseModel):
@@ -179,8 +177,7 @@ class RoomLayout(RoomLayoutBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Authentication schemas
 class Token(BaseModel):
@@ -1,19 +1,54 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, insert, delete, func, and_, case
 from datetime import datetime, date, timedelta
 from typing import List, Optional, Dict
+import time
 from ..models import Table, RoomLayout, TimeSlot, OperatingHours, Booking, User, RestaurantSettings
-from ..schemas import TableCreate, TableUpdate, RoomLayoutCreate, RoomLayoutUpdate, DashboardStats, BookingReport, UserCreate, UserUpdate, RestaurantSettingsUpdate
-from ..auth import get_password_hash
+from ..schemas import TableCreate, TableUpdate, RoomLayoutCreate, RoomLayoutUpdate, DashboardStats, BookingReport, UserCreate, UserUpdate, RestaurantSettingsUpdate, OperatingHoursCreate
+from ..auth import get_password_hash_async
+
+# Active time slots change only when an admin edits them, yet every public
+# booking page fetches the list. Serve reads from a short-lived in-process
+# cache and drop it on mutation.
+_TIME_SLOT_CACHE_TTL = 300  # seconds
+_time_slot_cache: Optional[tuple] = None  # (expires_at, slots)
+
+def _invalidate_time_slot_cache():
+    global _time_slot_cache
+    _time_slot_cache = None
+
+# Restaurant settings follow the same pattern: read constantly, written
+# almost never. expire_on_commit=False keeps the cached row usable after
+# its originating session closes.
+_SETTINGS_CACHE_TTL = 60  # seconds
+_settings_cache: Optional[tuple] = None  # (expires_at, settings row)
+
+def _invalidate_settings_cache():
+    global _settings_cache
+    _settings_cache = None
+
+# Operating hours are seven rows of read-mostly config rendered on every
+# admin page; same cache-and-invalidate treatment.
+_OPERATING_HOURS_CACHE_TTL = 300  # seconds
+_operating_hours_cache: Optional[tuple] = None  # (expires_at, rows)
+
+def _invalidate_operating_hours_cache():
+    global _operating_hours_cache
+    _operating_hours_cache = None
 
 class AdminService:
     def __init__(self):
         pass
-    
+
     # Restaurant Settings
-    def get_restaurant_settings(self, db: Session) -> Optional[RestaurantSettings]:
-        """Get restaurant settings (creates default if none exist)."""
-        settings = db.query(RestaurantSettings).first()
+    async def get_restaurant_settings(self, db: AsyncSession) -> Optional[RestaurantSettings]:
+        """Get restaurant settings (creates default if none exist, cached in-process)."""
+        global _settings_cache
+        cached = _settings_cache
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        result = await db.execute(select(RestaurantSettings).limit(1))
+        settings = result.scalar_one_or_none()
         if not settings:
             # Create default settings
             settings = RestaurantSettings(
@@ -22,48 +57,64 @@ class AdminService:
                 phone="(555) 123-4567"
             )
             db.add(settings)
-            db.commit()
-            db.refresh(settings)
+            await db.commit()
+            await db.refresh(settings)
+        _settings_cache = (time.monotonic() + _SETTINGS_CACHE_TTL, settings)
         return settings
-    
-    def update_restaurant_settings(self, db: Session, settings_data: RestaurantSettingsUpdate) -> RestaurantSettings:
+
+    async def update_restaurant_settings(self, db: AsyncSession, settings_data: RestaurantSettingsUpdate) -> RestaurantSettings:
         """Update restaurant settings."""
-        settings = db.query(RestaurantSettings).first()
+        result = await db.execute(select(RestaurantSettings).limit(1))
+        settings = result.scalar_one_or_none()
         if not settings:
             # Create new settings if none exist
             settings = RestaurantSettings()
             db.add(settings)
-        
+
         # Update fields
-        for field, value in settings_data.dict(exclude_unset=True).items():
+        for field, value in settings_data.model_dump(exclude_unset=True).items():
             setattr(settings, field, value)
-        
-        settings.updated_at = datetime.utcnow()
-        db.commit()
-        db.refresh(settings)
+
+        await db.commit()
+        await db.refresh(settings)
+        _invalidate_settings_cache()
         return settings
-    
+
     # User Management
-    def get_all_users(self, db: Session) -> List[User]:
-        """Get all users."""
-        return db.query(User).order_by(User.created_at.desc()).all()
-    
-    def create_user(self, db: Session, user_data: UserCreate) -> User:
+    async def get_all_users(self, db: AsyncSession) -> List[Dict]:
+        """Get all users.
+
+        List getters return Core row mappings rather than ORM instances:
+        the rows go straight to JSON, so identity-map and relationship
+        bookkeeping per row is pure overhead.
+        """
+        result = await db.execute(
+            select(
+                User.id, User.username, User.email, User.full_name, User.phone,
+                User.role, User.is_active, User.created_at
+            ).order_by(User.created_at.desc())
+        )
+        return result.mappings().all()
+
+    async def create_user(self, db: AsyncSession, user_data: UserCreate) -> User:
         """Create a new user."""
-        # Check if username or email already exists
-        existing_user = db.query(User).filter(
-            (User.username == user_data.username) | (User.email == user_data.email)
-        ).first()
-        
-        if existing_user:
-            if existing_user.username == user_data.username:
+        # Existence check only needs the two columns, not a hydrated row
+        result = await db.execute(
+            select(User.username, User.email).where(
+                (User.username == user_data.username) | (User.email == user_data.email)
+            ).limit(1)
+        )
+        existing = result.first()
+
+        if existing:
+            if existing.username == user_data.username:
                 raise ValueError("Username already exists")
             else:
                 raise ValueError("Email already exists")
-        
-        # Hash the password
-        hashed_password = get_password_hash(user_data.password)
-        
+
+        # Hash the password off the event loop
+        hashed_password = await get_password_hash_async(user_data.password)
+
         # Create user object
         db_user = User(
             username=user_data.username,
@@ -73,173 +124,187 @@ class AdminService:
             hashed_password=hashed_password,
             role=user_data.role if hasattr(user_data, 'role') else "system_user"
         )
-        
+
         db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
+        await db.commit()
+        await db.refresh(db_user)
         return db_user
-    
-    def update_user(self, db: Session, user_id: int, user_data: UserUpdate) -> Optional[User]:
+
+    async def update_user(self, db: AsyncSession, user_id: int, user_data: UserUpdate) -> Optional[User]:
         """Update an existing user."""
-        user = db.query(User).filter(User.id == user_id).first()
+        result = await db.execute(select(User).where(User.id == user_id))
+        user = result.scalar_one_or_none()
         if not user:
             return None
-        
+
         # Check if email is being changed and if it already exists
         if user_data.email and user_data.email != user.email:
-            existing_user = db.query(User).filter(User.email == user_data.email).first()
-            if existing_user:
+            result = await db.execute(select(User).where(User.email == user_data.email))
+            if result.scalar_one_or_none():
                 raise ValueError("Email already exists")
-        
+
         # Update fields
-        for field, value in user_data.dict(exclude_unset=True).items():
+        for field, value in user_data.model_dump(exclude_unset=True).items():
             setattr(user, field, value)
-        
-        user.updated_at = datetime.utcnow()
-        db.commit()
-        db.refresh(user)
+
+        await db.commit()
+        await db.refresh(user)
         return user
-    
-    def delete_user(self, db: Session, user_id: int) -> bool:
+
+    async def delete_user(self, db: AsyncSession, user_id: int) -> bool:
         """Delete a user (soft delete by setting inactive)."""
-        user = db.query(User).filter(User.id == user_id).first()
+        result = await db.execute(select(User).where(User.id == user_id))
+        user = result.scalar_one_or_none()
         if not user:
             return False
-        
+
         user.is_active = False
-        user.updated_at = datetime.utcnow()
-        db.commit()
+        await db.commit()
         return True
-    
-    def toggle_user_status(self, db: Session, user_id: int) -> Optional[User]:
+
+    async def toggle_user_status(self, db: AsyncSession, user_id: int) -> Optional[User]:
         """Toggle user active/inactive status."""
-        user = db.query(User).filter(User.id == user_id).first()
+        result = await db.execute(select(User).where(User.id == user_id))
+        user = result.scalar_one_or_none()
         if not user:
             return None
-        
+
         user.is_active = not user.is_active
-        user.updated_at = datetime.utcnow()
-        db.commit()
-        db.refresh(user)
+        await db.commit()
+        await db.refresh(user)
         return user
-    
+
     # Table Management
-    def create_table(self, db: Session, table_data: TableCreate) -> Table:
+    async def create_table(self, db: AsyncSession, table_data: TableCreate) -> Table:
         """Create a new table."""
-        db_table = Table(**table_data.dict())
+        db_table = Table(**table_data.model_dump())
         db.add(db_table)
-        db.commit()
-        db.refresh(db_table)
+        await db.commit()
+        await db.refresh(db_table)
         return db_table
-    
-    def delete_all_tables(self, db: Session) -> bool:
+
+    async def delete_all_tables(self, db: AsyncSession) -> bool:
         """Delete all tables (handles foreign key constraints)."""
         try:
-            # First, delete all bookings that reference tables
-            #from ..models import Booking
-            #db.query(Booking).delete()
-            #db.commit()
-            
-            # Now delete all tables
-            db.query(Table).delete()
-            db.commit()
+            await db.execute(delete(Table))
+            await db.commit()
             return True
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             print(f"Error deleting all tables: {e}")
             return False
 
 
-    def update_table(self, db: Session, table_number: str, table_data: TableUpdate) -> Optional[Table]:
+    async def update_table(self, db: AsyncSession, table_number: str, table_data: TableUpdate) -> Optional[Table]:
         """Update an existing table."""
-        table = db.query(Table).filter(Table.table_number == table_number).first()
+        result = await db.execute(select(Table).where(Table.table_number == table_number))
+        table = result.scalar_one_or_none()
         if not table:
             return None
-        
-        for field, value in table_data.dict(exclude_unset=True).items():
+
+        for field, value in table_data.model_dump(exclude_unset=True).items():
             setattr(table, field, value)
-        
-        table.updated_at = datetime.utcnow()
-        db.commit()
-        db.refresh(table)
+
+        await db.commit()
+        await db.refresh(table)
         return table
-    
-    def delete_table(self, db: Session, table_number: str) -> bool:
+
+    async def delete_table(self, db: AsyncSession, table_number: str) -> bool:
         """Delete a table (soft delete by setting inactive)."""
-        table = db.query(Table).filter(Table.table_number == table_number).first()
+        result = await db.execute(select(Table).where(Table.table_number == table_number))
+        table = result.scalar_one_or_none()
         if not table:
             return False
-        
+
         table.is_active = False
-        table.updated_at = datetime.utcnow()
-        db.commit()
+        await db.commit()
         return True
-    
-    def get_all_tables(self, db: Session) -> List[Table]:
+
+    async def get_all_tables(self, db: AsyncSession) -> List[Dict]:
         """Get all tables including inactive ones."""
-        return db.query(Table).order_by(Table.table_number).all()
-    
+        result = await db.execute(
+            select(
+                Table.table_number, Table.name, Table.seats, Table.location_x,
+                Table.location_y, Table.table_type, Table.is_active, Table.created_at
+            ).order_by(Table.table_number)
+        )
+        return result.mappings().all()
+
     # Delete yesterday and befor bookings
-    def get_active_tables(self, db: Session) -> List[Table]:
+    async def get_active_tables(self, db: AsyncSession) -> List[Dict]:
         """Get only active tables."""
-        return db.query(Table).filter(Table.is_active == True).order_by(Table.table_number).all()
-    
-    def delete_yesterday_bookings(self, db: Session) -> int:
+        result = await db.execute(
+            select(
+                Table.table_number, Table.name, Table.seats, Table.location_x,
+                Table.location_y, Table.table_type, Table.is_active, Table.created_at
+            ).where(Table.is_active == True).order_by(Table.table_number)
+        )
+        return result.mappings().all()
+
+    async def delete_yesterday_bookings(self, db: AsyncSession) -> int:
         """Delete all bookings from yesterday and earlier.
         Returns the number of deleted bookings. Safe when there are no rows.
         """
         # booking_date is a DateTime; delete everything with booking_date <= end of yesterday
         yesterday = date.today() - timedelta(days=1)
         cutoff = datetime.combine(yesterday, datetime.max.time())
-        query = db.query(Booking).filter(Booking.booking_date <= cutoff)
-        deleted_count = query.count()
-        # Use bulk delete; safe even if zero rows
-        query.delete(synchronize_session=False)
-        db.commit()
-        return deleted_count
-        
+        # Single bulk DELETE; the statement's rowcount gives the count without
+        # a separate scan of the same predicate
+        result = await db.execute(delete(Booking).where(Booking.booking_date <= cutoff))
+        await db.commit()
+        return result.rowcount
+
     # Room Layout Management
-    def create_room_layout(self, db: Session, layout_data: RoomLayoutCreate, user_id: int) -> RoomLayout:
+    async def create_room_layout(self, db: AsyncSession, layout_data: RoomLayoutCreate, user_id: int) -> RoomLayout:
         """Create a new room layout."""
-        db_layout = RoomLayout(**layout_data.dict(), created_by=user_id)
+        db_layout = RoomLayout(**layout_data.model_dump(), created_by=user_id)
         db.add(db_layout)
-        db.commit()
-        db.refresh(db_layout)
+        await db.commit()
+        await db.refresh(db_layout)
         return db_layout
-    
-    def update_room_layout(self, db: Session, layout_id: int, layout_data: RoomLayoutUpdate) -> Optional[RoomLayout]:
+
+    async def update_room_layout(self, db: AsyncSession, layout_id: int, layout_data: RoomLayoutUpdate) -> Optional[RoomLayout]:
         """Update an existing room layout."""
-        layout = db.query(RoomLayout).filter(RoomLayout.id == layout_id).first()
+        result = await db.execute(select(RoomLayout).where(RoomLayout.id == layout_id))
+        layout = result.scalar_one_or_none()
         if not layout:
             return None
-        
-        for field, value in layout_data.dict(exclude_unset=True).items():
+
+        for field, value in layout_data.model_dump(exclude_unset=True).items():
             setattr(layout, field, value)
-        
-        layout.updated_at = datetime.utcnow()
-        db.commit()
-        db.refresh(layout)
+
+        await db.commit()
+        await db.refresh(layout)
         return layout
-    
-    def delete_room_layout(self, db: Session, layout_id: int) -> bool:
+
+    async def delete_room_layout(self, db: AsyncSession, layout_id: int) -> bool:
         """Delete a room layout."""
-        layout = db.query(RoomLayout).filter(RoomLayout.id == layout_id).first()
+        result = await db.execute(select(RoomLayout).where(RoomLayout.id == layout_id))
+        layout = result.scalar_one_or_none()
         if not layout:
             return False
-        db.delete(layout)
-        db.commit()
-        return True 
+        await db.delete(layout)
+        await db.commit()
+        return True
 
-    def get_active_room_layout(self, db: Session) -> Optional[RoomLayout]:
+    async def get_active_room_layout(self, db: AsyncSession) -> Optional[RoomLayout]:
         """Get the currently active room layout."""
-        return db.query(RoomLayout).filter(RoomLayout.is_active == True).first()
-    
-    def get_all_room_layouts(self, db: Session) -> List[RoomLayout]:
+        result = await db.execute(select(RoomLayout).where(RoomLayout.is_active == True).limit(1))
+        return result.scalar_one_or_none()
+
+    async def get_all_room_layouts(self, db: AsyncSession) -> List[Dict]:
         """Get all room layouts."""
-        return db.query(RoomLayout).order_by(RoomLayout.created_at.desc()).all()
-    
+        result = await db.execute(
+            select(
+                RoomLayout.id, RoomLayout.name, RoomLayout.layout_data,
+                RoomLayout.is_active, RoomLayout.created_by,
+                RoomLayout.created_at, RoomLayout.updated_at
+            ).order_by(RoomLayout.created_at.desc())
+        )
+        return result.mappings().all()
+
     # Time Slot Management
-    def create_time_slot(self, db: Session, start_time: str, end_time: str, duration: int) -> TimeSlot:
+    async def create_time_slot(self, db: AsyncSession, start_time: str, end_time: str, duration: int) -> TimeSlot:
         """Create a new time slot."""
         db_slot = TimeSlot(
             start_time=start_time,
@@ -247,25 +312,39 @@ class AdminService:
             slot_duration=duration
         )
         db.add(db_slot)
-        db.commit()
-        db.refresh(db_slot)
+        await db.commit()
+        await db.refresh(db_slot)
+        _invalidate_time_slot_cache()
         return db_slot
-    
-    def get_all_time_slots(self, db: Session) -> List[TimeSlot]:
-        """Get all time slots."""
-        return db.query(TimeSlot).filter(TimeSlot.is_active == True).order_by(TimeSlot.start_time).all()
-    
+
+    async def get_all_time_slots(self, db: AsyncSession) -> List[TimeSlot]:
+        """Get all active time slots (cached in-process)."""
+        global _time_slot_cache
+        cached = _time_slot_cache
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        result = await db.execute(
+            select(TimeSlot).where(TimeSlot.is_active == True).order_by(TimeSlot.start_time)
+        )
+        slots = result.scalars().all()
+        _time_slot_cache = (time.monotonic() + _TIME_SLOT_CACHE_TTL, slots)
+        return slots
+
     # Operating Hours Management
-    def update_operating_hours(self, db: Session, day_of_week: int, opening_time: str, closing_time: str, is_open: bool) -> OperatingHours:
+    async def update_operating_hours(self, db: AsyncSession, day_of_week: int, opening_time: str, closing_time: str, is_open: bool) -> OperatingHours:
         """Update operating hours for a specific day."""
-        existing = db.query(OperatingHours).filter(OperatingHours.day_of_week == day_of_week).first()
-        
+        result = await db.execute(
+            select(OperatingHours).where(OperatingHours.day_of_week == day_of_week)
+        )
+        existing = result.scalar_one_or_none()
+
         if existing:
             existing.opening_time = opening_time
             existing.closing_time = closing_time
             existing.is_open = is_open
-            db.commit()
-            db.refresh(existing)
+            await db.commit()
+            await db.refresh(existing)
+            _invalidate_operating_hours_cache()
             return existing
         else:
             new_hours = OperatingHours(
@@ -275,98 +354,152 @@ class AdminService:
                 is_open=is_open
             )
             db.add(new_hours)
-            db.commit()
-            db.refresh(new_hours)
+            await db.commit()
+            await db.refresh(new_hours)
+            _invalidate_operating_hours_cache()
             return new_hours
-    
-    def get_operating_hours(self, db: Session) -> List[OperatingHours]:
-        """Get all operating hours."""
-        return db.query(OperatingHours).order_by(OperatingHours.day_of_week).all()
-    
+
+    async def bulk_upsert_operating_hours(self, db: AsyncSession, hours: List[OperatingHoursCreate]) -> List[OperatingHours]:
+        """Replace operating hours for the given days in one statement each way.
+
+        A week is at most seven rows, but the per-day update endpoint costs a
+        SELECT plus an UPDATE/INSERT and a commit per day; this does a single
+        DELETE and a single multi-row INSERT.
+        """
+        days = [h.day_of_week for h in hours]
+        await db.execute(delete(OperatingHours).where(OperatingHours.day_of_week.in_(days)))
+        await db.execute(insert(OperatingHours), [h.model_dump() for h in hours])
+        await db.commit()
+        _invalidate_operating_hours_cache()
+        result = await db.execute(
+            select(OperatingHours)
+            .where(OperatingHours.day_of_week.in_(days))
+            .order_by(OperatingHours.day_of_week)
+        )
+        return result.scalars().all()
+
+    async def get_operating_hours(self, db: AsyncSession) -> List[Dict]:
+        """Get all operating hours (cached in-process)."""
+        global _operating_hours_cache
+        cached = _operating_hours_cache
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        result = await db.execute(
+            select(
+                OperatingHours.id, OperatingHours.day_of_week,
+                OperatingHours.opening_time, OperatingHours.closing_time,
+                OperatingHours.is_open, OperatingHours.created_at
+            ).order_by(OperatingHours.day_of_week)
+        )
+        rows = result.mappings().all()
+        _operating_hours_cache = (time.monotonic() + _OPERATING_HOURS_CACHE_TTL, rows)
+        return rows
+
     # Dashboard and Reporting
-    def get_dashboard_stats(self, db: Session) -> DashboardStats:
-        """Get dashboard statistics."""
+    async def get_dashboard_stats(self, db: AsyncSession) -> DashboardStats:
+        """Get dashboard statistics.
+
+        The dashboard polls this endpoint, so all counts come back in one
+        row via conditional aggregates rather than five separate COUNTs.
+        """
         today = date.today()
-        
-        total_bookings = db.query(Booking).count()
-        today_bookings = db.query(Booking).filter(Booking.booking_date == today).count()
-        pending_bookings = db.query(Booking).filter(Booking.status == "confirmed").count()
-        
-        # Calculate occupancy rate for today
-        active_tables = db.query(Table).filter(Table.is_active == True).count()
-        if active_tables > 0:
-            today_occupied = db.query(Booking).filter(
-                and_(
+
+        active_tables_sq = (
+            select(func.count())
+            .select_from(Table)
+            .where(Table.is_active == True)
+            .scalar_subquery()
+        )
+        row = (await db.execute(
+            select(
+                func.count(Booking.id),
+                func.coalesce(func.sum(case((Booking.booking_date == today, 1), else_=0)), 0),
+                func.coalesce(func.sum(case((Booking.status == "confirmed", 1), else_=0)), 0),
+                func.coalesce(func.sum(case((and_(
                     Booking.booking_date == today,
                     Booking.status == "confirmed"
-                )
-            ).count()
-            occupancy_rate = (today_occupied / active_tables) * 100
-        else:
-            occupancy_rate = 0.0
-        
+                ), 1), else_=0)), 0),
+                active_tables_sq,
+            )
+        )).one()
+        total_bookings, today_bookings, pending_bookings, today_occupied, active_tables = row
+
+        occupancy_rate = (today_occupied / active_tables * 100) if active_tables > 0 else 0.0
+
         return DashboardStats(
             total_bookings=total_bookings,
             today_bookings=today_bookings,
             pending_bookings=pending_bookings,
             occupancy_rate=occupancy_rate
         )
-    
-    def get_booking_report(self, db: Session, start_date: date, end_date: date) -> BookingReport:
-        """Get booking report for a date range."""
-        bookings = db.query(Booking).filter(
-            and_(
-                Booking.booking_date >= start_date,
-                Booking.booking_date <= end_date
-            )
-        ).all()
-        
-        total_bookings = len(bookings)
-        
-        # Group by source
-        bookings_by_source = {}
-        for booking in bookings:
-            source = booking.source
-            if source not in bookings_by_source:
-                bookings_by_source[source] = 0
-            bookings_by_source[source] += 1
-        
-        # Calculate daily occupancy trends
+
+    async def get_booking_report(self, db: AsyncSession, start_date: date, end_date: date) -> BookingReport:
+        """Get booking report for a date range.
+
+        Aggregation happens in SQL: one GROUP BY per day, one GROUP BY per
+        source and one table count, instead of hydrating every booking row
+        and issuing two COUNTs per day of the range.
+        """
+        range_filter = and_(
+            Booking.booking_date >= start_date,
+            Booking.booking_date <= end_date
+        )
+
+        source_rows = await db.execute(
+            select(Booking.source, func.count())
+            .where(range_filter)
+            .group_by(Booking.source)
+        )
+        bookings_by_source = {source: count for source, count in source_rows.all()}
+        total_bookings = sum(bookings_by_source.values())
+
+        day_col = func.date(Booking.booking_date)
+        daily_rows = await db.execute(
+            select(day_col, func.count())
+            .where(and_(range_filter, Booking.status == "confirmed"))
+            .group_by(day_col)
+        )
+        daily_counts = {day: count for day, count in daily_rows.all()}
+
+        active_tables = (await db.execute(
+            select(func.count()).select_from(Table).where(Table.is_active == True)
+        )).scalar()
+
+        # Walk the range only to fill zeros for days without bookings
         occupancy_trends = []
         current_date = start_date
         while current_date <= end_date:
-            daily_bookings = db.query(Booking).filter(
-                and_(
-                    Booking.booking_date == current_date,
-                    Booking.status == "confirmed"
-                )
-            ).count()
-            
-            active_tables = db.query(Table).filter(Table.is_active == True).count()
+            daily_bookings = daily_counts.get(current_date, 0)
             daily_occupancy = (daily_bookings / active_tables * 100) if active_tables > 0 else 0
-            
+
             occupancy_trends.append({
                 "date": current_date.strftime("%Y-%m-%d"),
                 "bookings": daily_bookings,
                 "occupancy_rate": daily_occupancy
             })
-            
+
             current_date += timedelta(days=1)
-        
+
         return BookingReport(
             date_range=f"{start_date} to {end_date}",
             total_bookings=total_bookings,
             bookings_by_source=bookings_by_source,
             occupancy_trends=occupancy_trends
         )
-    
-    def get_user_management_data(self, db: Session) -> Dict:
+
+    async def get_user_management_data(self, db: AsyncSession) -> Dict:
         """Get user management data for admin dashboard."""
-        total_users = db.query(User).count()
-        active_users = db.query(User).filter(User.is_active == True).count()
-        admin_users = db.query(User).filter(User.role == "admin").count()
-        system_users = db.query(User).filter(User.role == "system_user").count()
-        
+        total_users = (await db.execute(select(func.count()).select_from(User))).scalar()
+        active_users = (await db.execute(
+            select(func.count()).select_from(User).where(User.is_active == True)
+        )).scalar()
+        admin_users = (await db.execute(
+            select(func.count()).select_from(User).where(User.role == "admin")
+        )).scalar()
+        system_users = (await db.execute(
+            select(func.count()).select_from(User).where(User.role == "system_user")
+        )).scalar()
+
         return {
             "total_users": total_users,
             "active_users": active_users,
@@ -1,254 +1,427 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
-from datetime import datetime, date, timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload, load_only
+from sqlalchemy import select, delete, exists, and_, bindparam
+from datetime import datetime, date, time as dt_time, timedelta
+from functools import lru_cache
 from typing import List, Optional, Dict
-import json
+import orjson
+import math
+import random
+import time
 try:
-    import redis  # type: ignore
+    import redis.asyncio as redis  # type: ignore
 except Exception:  # pragma: no cover
     redis = None
 from ..models import Booking, Table, TableBlock, TimeSlot, OperatingHours, RoomLayout
 from ..schemas import BookingCreate, BookingUpdate, TableAvailability
 from ..config import settings
 
+# Statements for the per-booking availability checks, built once at import.
+# Reusing the same statement object lets the engine's compilation cache hit
+# on every execution instead of re-compiling identical SQL per request.
+_BLOCK_STMT = select(
+    exists().where(
+        and_(
+            TableBlock.table_number == bindparam("table_number"),
+            TableBlock.start_date <= bindparam("target_dt"),
+            TableBlock.end_date >= bindparam("target_dt"),
+        )
+    )
+)
+
+_BOOKING_EXISTS_STMT = select(
+    exists().where(
+        and_(
+            Booking.table_number == bindparam("table_number"),
+            Booking.booking_date == bindparam("booking_date"),
+            Booking.status == "confirmed",
+            # Canonical interval-overlap form; equivalent to the old
+            # three-branch OR but sargable with two predicates
+            Booking.start_time < bindparam("slot_end"),
+            Booking.end_time > bindparam("slot_start"),
+        )
+    )
+)
+
+# L1 cache sizing for availability responses: short TTL because bookings
+# mutate it, small cap because keys are (date, slot) pairs.
+_L1_TTL = 30  # seconds
+_L1_MAX = 512
+
+
+@lru_cache(maxsize=512)
+def _parse_hhmm(value: str) -> dt_time:
+    """Parse an "HH:MM" slot string to a time, memoized.
+
+    Configured slots give only a handful of distinct strings, but the value
+    ultimately comes from an unauthenticated query param, so the cache is
+    bounded rather than letting arbitrary callers grow it without limit.
+    """
+    hours, minutes = value.split(":")
+    return dt_time(hour=int(hours), minute=int(minutes))
+
+# One bounded connection pool per process, shared by every BookingService
+# instance: no per-instance socket churn, and a hard cap on descriptors
+# under load.
+_REDIS_POOL = None
+if redis is not None:
+    try:
+        _REDIS_POOL = redis.ConnectionPool.from_url(settings.REDIS_URL, max_connections=50)
+    except Exception:  # pragma: no cover
+        _REDIS_POOL = None
+
+# Redis TTL for availability entries, with probabilistic early refresh
+# (XFetch) so a popular key is recomputed by one request shortly before
+# expiry instead of by every concurrent request right after it.
+_REDIS_TTL = 300  # seconds
+_XFETCH_BETA = 8.0
+
 class BookingService:
     def __init__(self):
-        self.redis_client = None
-        if redis is not None:
-            try:
-                self.redis_client = redis.Redis.from_url(settings.REDIS_URL)
-                # ping to verify
-                self.redis_client.ping()
-            except Exception:
-                self.redis_client = None
-    
-    def get_table_availability(self, db: Session, target_date: date, time_slot: str) -> List[TableAvailability]:
+        # In-process L1 in front of Redis: ultra-hot (date, slot) keys skip
+        # the Redis RTT and JSON decode entirely. key -> (expires_at, value)
+        self._l1: dict = {}
+        # Async client on the shared module pool; connects lazily and
+        # per-call errors are swallowed by the best-effort cache paths.
+        self.redis_client = redis.Redis(connection_pool=_REDIS_POOL) if _REDIS_POOL is not None else None
+
+    async def get_table_availability(self, db: AsyncSession, target_date: date, time_slot: str) -> List[TableAvailability]:
         """Get availability for all tables on a specific date and time slot.
         Only tables included in the active room layout are considered (if a layout exists).
         """
-        # Check cache if available
+        # Check caches if available: L1 first, then Redis
         cache_key = f"availability:{target_date}:{time_slot}"
+        l1_hit = self._l1.get(cache_key)
+        if l1_hit and l1_hit[0] > time.monotonic():
+            return l1_hit[1]
         if self.redis_client:
             try:
-                cached_data = self.redis_client.get(cache_key)
+                cached_data = await self.redis_client.get(cache_key)
                 if cached_data:
-                    return json.loads(cached_data)
+                    payload = orjson.loads(cached_data)
+                    data = payload["data"] if isinstance(payload, dict) else payload
+                    refresh_early = False
+                    if isinstance(payload, dict):
+                        remaining = max(_REDIS_TTL - (time.time() - payload.get("computed_at", 0)), 0.0)
+                        refresh_early = random.random() < math.exp(-_XFETCH_BETA * remaining / _REDIS_TTL)
+                    if not refresh_early:
+                        self._l1_store(cache_key, data)
+                        return data
+                    # Nearing expiry: the request that wins the short lock
+                    # recomputes below; everyone else serves the stale value
+                    if not await self.redis_client.set(f"availability:lock:{cache_key}", 1, nx=True, ex=5):
+                        return data
             except Exception:
                 pass
-        
+
         # Parse time slot
         start_time, end_time = time_slot.split("-")
-        
+
         # Determine tables from active layout (if any)
-        layout = db.query(RoomLayout).filter(RoomLayout.is_active == True).first()
-        table_query = db.query(Table).filter(Table.is_active == True)
+        layout_result = await db.execute(select(RoomLayout).where(RoomLayout.is_active == True).limit(1))
+        layout = layout_result.scalar_one_or_none()
+        # Availability only reads these four columns from Table
+        table_stmt = (
+            select(Table)
+            .options(load_only(Table.table_number, Table.name, Table.seats, Table.table_type))
+            .where(Table.is_active == True)
+        )
         layout_table_numbers: Optional[List[str]] = None
-        
+
         if layout and layout.layout_data and isinstance(layout.layout_data, dict):
             tables_section = layout.layout_data.get("tables")
             if isinstance(tables_section, list) and len(tables_section) > 0:
                 # Use table_number matching (more reliable)
                 layout_table_numbers = [t.get("table_number") for t in tables_section if t.get("table_number")]
-        
+
         # Filter by layout table numbers if available
         if layout_table_numbers:
-            table_query = table_query.filter(Table.table_number.in_(layout_table_numbers))
-        
-        tables = table_query.all()
-        
-        # If layout defined, keep order as in layout
+            table_stmt = table_stmt.where(Table.table_number.in_(layout_table_numbers))
+
+        tables = (await db.execute(table_stmt)).scalars().all()
+
+        # If layout defined, keep order as in layout: a single keyed sort,
+        # no second pass rebuilding the list through a dict
         if layout_table_numbers:
-            table_map_num = {t.table_number: t for t in tables}
-            tables = [table_map_num[num] for num in layout_table_numbers if num in table_map_num]
-        
+            order_map = {num: i for i, num in enumerate(layout_table_numbers)}
+            tables = sorted(tables, key=lambda t: order_map[t.table_number])
+
+        # Batch the per-table block/booking checks into two queries instead of
+        # two round trips per table: the critical path stays at three SELECTs
+        # total no matter how many tables the layout has.
+        table_numbers = [t.table_number for t in tables]
+        target_datetime = datetime.combine(target_date, _parse_hhmm(start_time))
+
+        blocked_numbers: set = set()
+        bookings_by_table: Dict[str, List[Dict]] = {}
+        if table_numbers:
+            blocked_result = await db.execute(
+                select(TableBlock.table_number).where(
+                    and_(
+                        TableBlock.table_number.in_(table_numbers),
+                        TableBlock.start_date <= target_datetime,
+                        TableBlock.end_date >= target_datetime
+                    )
+                )
+            )
+            blocked_numbers = set(blocked_result.scalars().all())
+
+            # Column select: these rows only feed the booked_slots dicts, so
+            # skip ORM hydration entirely
+            bookings_result = await db.execute(
+                select(
+                    Booking.table_number, Booking.id, Booking.start_time,
+                    Booking.end_time, Booking.guest_name, Booking.guest_phone,
+                    Booking.number_of_people, Booking.special_occasion
+                ).where(
+                    and_(
+                        Booking.table_number.in_(table_numbers),
+                        Booking.booking_date == target_date,
+                        Booking.status == "confirmed",
+                        Booking.start_time < end_time,
+                        Booking.end_time > start_time
+                    )
+                )
+            )
+            for row in bookings_result.mappings():
+                bookings_by_table.setdefault(row["table_number"], []).append({
+                    "booking_id": row["id"],
+                    "start_time": row["start_time"],
+                    "end_time": row["end_time"],
+                    "guest_name": row["guest_name"],
+                    "guest_phone": row["guest_phone"],
+                    "number_of_people": row["number_of_people"],
+                    "special_occasion": row["special_occasion"]
+                })
+
+        # Build plain dicts: the values come straight from our own columns,
+        # so there is nothing to validate, and the cache write below gets a
+        # JSON-ready list with no per-item model_dump() pass
         availability_list = []
-        
         for table in tables:
-            # Check if table is blocked
-            is_blocked = self._is_table_blocked(db, table.table_number, target_date, start_time, end_time)
-            
-            # Check existing bookings
-            existing_bookings = self._get_existing_bookings(db, table.table_number, target_date, start_time, end_time)
-            
-            is_available = not is_blocked and len(existing_bookings) == 0
-            
-            availability = TableAvailability(
-                table_number=table.table_number,
-                name=table.name,
-                seats=table.seats,
-                table_type=table.table_type,
-                is_available=is_available,
-                booked_slots=existing_bookings
-            )
-            availability_list.append(availability)
-        
-        # Cache the result for 5 minutes
+            existing_bookings = bookings_by_table.get(table.table_number, [])
+            availability_list.append({
+                "table_number": table.table_number,
+                "name": table.name,
+                "seats": table.seats,
+                "table_type": table.table_type,
+                "is_available": table.table_number not in blocked_numbers and len(existing_bookings) == 0,
+                "booked_slots": existing_bookings,
+            })
+
+        # Cache the result (L1 plus Redis for 5 minutes)
+        self._l1_store(cache_key, availability_list)
         if self.redis_client:
             try:
-                self.redis_client.setex(cache_key, 300, json.dumps([av.dict() for av in availability_list]))
+                payload = {
+                    "data": availability_list,
+                    "computed_at": time.time(),
+                }
+                # Register the key in its date's tag set so invalidation is
+                # one SMEMBERS + DEL instead of a SCAN over the keyspace
+                tag_key = f"availability:tag:{target_date}"
+                pipe = self.redis_client.pipeline()
+                pipe.setex(cache_key, _REDIS_TTL, orjson.dumps(payload))
+                pipe.sadd(tag_key, cache_key)
+                pipe.expire(tag_key, _REDIS_TTL)
+                await pipe.execute()
             except Exception:
                 pass
-        
-        return availability_list
-    
-    def create_booking(self, db: Session, booking_data: BookingCreate, user_id: int) -> Optional[Booking]:
-        """Create a new booking with best-effort lock when Redis is available."""
-        lock_key = f"booking_lock:{booking_data.table_number}:{booking_data.booking_date}:{booking_data.start_time}"
-        
-        # Fallback path if Redis not available
-        if not self.redis_client:
-            if not self._is_table_available(db, booking_data.table_number, booking_data.booking_date,
-                                            booking_data.start_time, booking_data.end_time):
-                return None
-            db_booking = Booking(
-                user_id=user_id,
-                table_number=booking_data.table_number,
-                booking_date=booking_data.booking_date,
-                start_time=booking_data.start_time,
-                end_time=booking_data.end_time,
-                guest_name=booking_data.guest_name,
-                guest_phone=booking_data.guest_phone,
-                number_of_people=booking_data.number_of_people,
-                special_occasion=booking_data.special_occasion,
-                source="web"
-            )
-            db.add(db_booking)
-            db.commit()
-            db.refresh(db_booking)
-            return db_booking
-        
-        # With Redis lock
-        with self.redis_client.lock(lock_key, timeout=10):
-            if not self._is_table_available(db, booking_data.table_number, booking_data.booking_date, 
-                                         booking_data.start_time, booking_data.end_time):
-                return None
-            db_booking = Booking(
-                user_id=user_id,
-                table_number=booking_data.table_number,
-                booking_date=booking_data.booking_date,
-                start_time=booking_data.start_time,
-                end_time=booking_data.end_time,
-                guest_name=booking_data.guest_name,
-                guest_phone=booking_data.guest_phone,
-                number_of_people=booking_data.number_of_people,
-                special_occasion=booking_data.special_occasion,
-                source="web"
-            )
-            db.add(db_booking)
-            db.commit()
-            db.refresh(db_booking)
-            # Clear cache best-effort
-            self._clear_availability_cache(booking_data.booking_date, booking_data.start_time)
-            return db_booking
-    
-    def update_booking(self, db: Session, booking_id: int, booking_data: BookingUpdate) -> Optional[Booking]:
+
+        # Models only for the return value, constructed without re-validation
+        return [TableAvailability.model_construct(**row) for row in availability_list]
+
+    def _l1_store(self, cache_key: str, value):
+        if len(self._l1) >= _L1_MAX:
+            self._l1.clear()
+        self._l1[cache_key] = (time.monotonic() + _L1_TTL, value)
+
+    async def get_table_availability_for_day(self, db: AsyncSession, target_date: date, time_slots: List[str]) -> Dict[str, List]:
+        """Get availability for several time slots of one day.
+
+        Cached slots come back in a single pipelined Redis round trip
+        instead of one GET per slot; only the misses hit the database.
+        """
+        results: Dict[str, List] = {}
+        missing = list(time_slots)
+
+        if self.redis_client and time_slots:
+            try:
+                pipe = self.redis_client.pipeline()
+                for slot in time_slots:
+                    pipe.get(f"availability:{target_date}:{slot}")
+                cached = await pipe.execute()
+                missing = []
+                for slot, raw in zip(time_slots, cached):
+                    if raw:
+                        payload = orjson.loads(raw)
+                        results[slot] = payload["data"] if isinstance(payload, dict) else payload
+                    else:
+                        missing.append(slot)
+            except Exception:
+                missing = list(time_slots)
+
+        for slot in missing:
+            availability = await self.get_table_availability(db, target_date, slot)
+            results[slot] = [
+                av.model_dump() if isinstance(av, TableAvailability) else av
+                for av in availability
+            ]
+
+        return results
+
+    async def create_booking(self, db: AsyncSession, booking_data: BookingCreate, user_id: int) -> Optional[Booking]:
+        """Create a new booking.
+
+        The availability check is advisory; the ux_booking_slot partial
+        unique index is the authority on conflicts, so a lost race surfaces
+        as IntegrityError instead of a double booking. No distributed lock
+        needed, and correctness holds even with Redis down.
+        """
+        if not await self._is_table_available(db, booking_data.table_number, booking_data.booking_date,
+                                              booking_data.start_time, booking_data.end_time):
+            return None
+        db_booking = Booking(
+            user_id=user_id,
+            table_number=booking_data.table_number,
+            booking_date=booking_data.booking_date,
+            start_time=booking_data.start_time,
+            end_time=booking_data.end_time,
+            guest_name=booking_data.guest_name,
+            guest_phone=booking_data.guest_phone,
+            number_of_people=booking_data.number_of_people,
+            special_occasion=booking_data.special_occasion,
+            source="web"
+        )
+        db.add(db_booking)
+        try:
+            await db.commit()
+        except IntegrityError:
+            # A concurrent request confirmed the same slot first
+            await db.rollback()
+            return None
+        await db.refresh(db_booking)
+        # Clear cache best-effort
+        await self._clear_availability_cache(booking_data.booking_date, booking_data.start_time)
+        return db_booking
+
+    async def update_booking(self, db: AsyncSession, booking_id: int, booking_data: BookingUpdate) -> Optional[Booking]:
         """Update an existing booking."""
-        booking = db.query(Booking).filter(Booking.id == booking_id).first()
+        result = await db.execute(select(Booking).where(Booking.id == booking_id))
+        booking = result.scalar_one_or_none()
         if not booking:
             return None
-        
-        for field, value in booking_data.dict(exclude_unset=True).items():
+
+        for field, value in booking_data.model_dump(exclude_unset=True).items():
             setattr(booking, field, value)
-        
-        booking.updated_at = datetime.utcnow()
-        db.commit()
-        db.refresh(booking)
+
+        await db.commit()
+        await db.refresh(booking)
         # Clear cache best-effort
-        self._clear_availability_cache(booking.booking_date, booking.start_time)
+        await self._clear_availability_cache(booking.booking_date, booking.start_time)
         return booking
-    
-    def cancel_booking(self, db: Session, booking_id: int) -> bool:
+
+    async def cancel_booking(self, db: AsyncSession, booking_id: int) -> bool:
         """Cancel a booking."""
-        booking = db.query(Booking).filter(Booking.id == booking_id).first()
+        result = await db.execute(select(Booking).where(Booking.id == booking_id))
+        booking = result.scalar_one_or_none()
         if not booking:
             return False
-        
+
         booking.status = "cancelled"
-        booking.updated_at = datetime.utcnow()
-        db.commit()
+        await db.commit()
         # Clear cache
-        self._clear_availability_cache(booking.booking_date, booking.start_time)
+        await self._clear_availability_cache(booking.booking_date, booking.start_time)
         return True
-    
-    def get_user_bookings(self, db: Session, user_id: int) -> List[Booking]:
+
+    async def get_user_bookings(self, db: AsyncSession, user_id: int) -> List[Booking]:
         """Get all bookings for a specific user."""
-        return db.query(Booking).filter(Booking.user_id == user_id).order_by(Booking.booking_date.desc()).all()
+        result = await db.execute(
+            select(Booking)
+            .options(selectinload(Booking.user), selectinload(Booking.table))
+            .where(Booking.user_id == user_id)
+            .order_by(Booking.booking_date.desc())
+        )
+        return result.scalars().all()
 
-    def get_all_bookings(self, db: Session) -> List[Booking]:
+    async def get_all_bookings(self, db: AsyncSession) -> List[Booking]:
         """Get all bookings for all users (for authenticated users)."""
-        return db.query(Booking).order_by(Booking.booking_date.desc()).all()
-    
-    def get_booking_by_id(self, db: Session, booking_id: int) -> Optional[Booking]:
+        result = await db.execute(
+            select(Booking)
+            .options(selectinload(Booking.user), selectinload(Booking.table))
+            .order_by(Booking.booking_date.desc())
+        )
+        return result.scalars().all()
+
+    async def get_booking_by_id(self, db: AsyncSession, booking_id: int) -> Optional[Booking]:
         """Get a specific booking by ID."""
-        return db.query(Booking).filter(Booking.id == booking_id).first()
-    
-    def delete_yesterday_bookings(self, db: Session) -> int:
+        result = await db.execute(
+            select(Booking)
+            .options(selectinload(Booking.user), selectinload(Booking.table))
+            .where(Booking.id == booking_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def delete_yesterday_bookings(self, db: AsyncSession) -> int:
         """Delete all bookings from yesterday and earlier.
         Returns the number of deleted bookings. Safe when there are no rows.
         """
         # booking_date is a DateTime; delete everything with booking_date <= end of yesterday
         yesterday = date.today() - timedelta(days=1)
         cutoff = datetime.combine(yesterday, datetime.max.time())
-        query = db.query(Booking).filter(Booking.booking_date <= cutoff)
-        deleted_count = query.count()
-        # Use bulk delete; safe even if zero rows
-        query.delete(synchronize_session=False)
-        db.commit()
-        return deleted_count
-    
-    
-    def _is_table_blocked(self, db: Session, table_number: str, target_date: date, start_time: str, end_time: str) -> bool:
+        # Single bulk DELETE; the statement's rowcount gives the count without
+        # a separate scan of the same predicate
+        result = await db.execute(delete(Booking).where(Booking.booking_date <= cutoff))
+        await db.commit()
+        return result.rowcount
+
+
+    async def _is_table_blocked(self, db: AsyncSession, table_number: str, target_date: date, start_time: str, end_time: str) -> bool:
         """Check if a table is blocked for the given date and time."""
-        target_datetime = datetime.combine(target_date, datetime.strptime(start_time, "%H:%M").time())
-        blocked = db.query(TableBlock).filter(
-            and_(
-                TableBlock.table_number == table_number,
-                TableBlock.start_date <= target_datetime,
-                TableBlock.end_date >= target_datetime
-            )
-        ).first()
-        return blocked is not None
-    
-    def _get_existing_bookings(self, db: Session, table_number: str, target_date: date, start_time: str, end_time: str) -> List[Dict]:
-        """Get existing bookings for a table on a specific date and time."""
-        bookings = db.query(Booking).filter(
-            and_(
-                Booking.table_number == table_number,
-                Booking.booking_date == target_date,
-                Booking.status == "confirmed",
-                or_(
-                    and_(Booking.start_time <= start_time, Booking.end_time > start_time),
-                    and_(Booking.start_time < end_time, Booking.end_time >= end_time),
-                    and_(Booking.start_time >= start_time, Booking.end_time <= end_time)
-                )
-            )
-        ).all()
-        return [
-            {
-                "booking_id": booking.id,
-                "start_time": booking.start_time,
-                "end_time": booking.end_time,
-                "guest_name": booking.guest_name,
-                "guest_phone": booking.guest_phone,
-                "number_of_people": booking.number_of_people,
-                "special_occasion": booking.special_occasion
-            }
-            for booking in bookings
-        ]
-    
-    def _is_table_available(self, db: Session, table_number: str, target_date: date, start_time: str, end_time: str) -> bool:
+        target_datetime = datetime.combine(target_date, _parse_hhmm(start_time))
+        # SELECT EXISTS(...) returns a bare bool; no row to materialize
+        result = await db.execute(
+            _BLOCK_STMT,
+            {"table_number": table_number, "target_dt": target_datetime},
+        )
+        return bool(result.scalar())
+
+    async def _is_table_available(self, db: AsyncSession, table_number: str, target_date: date, start_time: str, end_time: str) -> bool:
         """Check if a table is available for the given date and time."""
-        if self._is_table_blocked(db, table_number, target_date, start_time, end_time):
+        if await self._is_table_blocked(db, table_number, target_date, start_time, end_time):
             return False
-        existing_bookings = self._get_existing_bookings(db, table_number, target_date, start_time, end_time)
-        return len(existing_bookings) == 0
-    
-    def _clear_availability_cache(self, target_date: date, start_time: str):
-        """Clear availability cache for a specific date and time (best-effort)."""
+        # SELECT EXISTS, same shape as the blocked check: no rows or dicts
+        # materialized just to test emptiness
+        result = await db.execute(
+            _BOOKING_EXISTS_STMT,
+            {
+                "table_number": table_number,
+                "booking_date": target_date,
+                "slot_start": start_time,
+                "slot_end": end_time,
+            },
+        )
+        return not result.scalar()
+
+    async def _clear_availability_cache(self, target_date: date, start_time: str):
+        """Clear all availability cache entries for a date (best-effort).
+
+        A booking change can affect every slot that overlaps it, so drop the
+        whole day's keys — tracked in the date's tag set at write time — with
+        one SMEMBERS plus one varargs DEL, no keyspace scan.
+        """
+        # Call sites pass the booking's DateTime; cache keys use the date
+        if isinstance(target_date, datetime):
+            target_date = target_date.date()
+        prefix = f"availability:{target_date}:"
+        for key in [k for k in self._l1 if k.startswith(prefix)]:
+            self._l1.pop(key, None)
         if not self.redis_client:
             return
         try:
-            cache_key = f"availability:{target_date}:{start_time}"
-            self.redis_client.delete(cache_key)
+            tag_key = f"availability:tag:{target_date}"
+            keys = await self.redis_client.smembers(tag_key)
+            await self.redis_client.delete(tag_key, *keys)
         except Exception:
-            pass
\ No newline at end of file
+            pass
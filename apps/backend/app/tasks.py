@@ -0,0 +1,70 @@
+"""Celery tasks for long-running admin maintenance and reporting jobs.
+
+Run a worker with:
+    celery -A app.tasks worker --loglevel=info
+"""
+import asyncio
+from datetime import date
+
+from celery import Celery
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import NullPool
+
+from .config import settings
+from .services.admin_service import AdminService
+from .services.booking_service import BookingService
+
+celery_app = Celery(
+    "table_booking",
+    broker=settings.REDIS_URL,
+    backend=settings.REDIS_URL,
+)
+celery_app.conf.task_serializer = "json"
+celery_app.conf.result_serializer = "json"
+
+admin_service = AdminService()
+booking_service = BookingService()
+
+
+def _task_engine():
+    """Engine owned by a single task invocation.
+
+    asyncio.run() gives every task a fresh event loop, so connections pooled
+    by the shared app engine would outlive their loop and break the next
+    task in the same worker. Each task opens its own NullPool engine on its
+    own loop and disposes it before the loop closes.
+    """
+    engine = create_async_engine(
+        settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://"),
+        poolclass=NullPool,
+    )
+    return engine, async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
+
+
+@celery_app.task(name="app.tasks.run_booking_report")
+def run_booking_report(start_date: str, end_date: str) -> dict:
+    """Build the booking report for a date range off the request path."""
+    async def _run():
+        engine, session_factory = _task_engine()
+        try:
+            async with session_factory() as db:
+                report = await admin_service.get_booking_report(
+                    db, date.fromisoformat(start_date), date.fromisoformat(end_date)
+                )
+            return report.model_dump()
+        finally:
+            await engine.dispose()
+    return asyncio.run(_run())
+
+
+@celery_app.task(name="app.tasks.delete_old_bookings")
+def delete_old_bookings() -> int:
+    """Delete all bookings from yesterday and earlier."""
+    async def _run():
+        engine, session_factory = _task_engine()
+        try:
+            async with session_factory() as db:
+                return await booking_service.delete_yesterday_bookings(db)
+        finally:
+            await engine.dispose()
+    return asyncio.run(_run())
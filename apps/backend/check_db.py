@@ -10,8 +10,14 @@ import os
 # Add the app directory to the Python path
 sys.path.append(os.path.dirname(__file__))
 
-from app.database import SessionLocal
-from sqlalchemy import text
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.config import settings
+
+# CLI script runs outside the event loop, so use a plain sync engine here
+engine = create_engine(settings.DATABASE_URL)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 def check_database_status():
     """Check the current status of the database."""
@@ -5,17 +5,41 @@ Simple working version of the Table Reservation Booking System
 import sys
 import os
 
-# Add the current directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Add the current directory to Python path (once; reimports and reloads
+# find it already present and skip the resolve/insert)
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
+
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.config import settings
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open a shared asyncpg pool for the process (best-effort).
+
+    asyncpg keeps DB work off the event loop; the app still serves its
+    static endpoints when the database is unreachable.
+    """
+    try:
+        import asyncpg
+        app.state.pool = await asyncpg.create_pool(settings.DATABASE_URL, min_size=1, max_size=5)
+    except Exception:
+        app.state.pool = None
+    yield
+    if app.state.pool is not None:
+        await app.state.pool.close()
+
 # Create FastAPI app
 app = FastAPI(
     title="Table Reservation System",
     description="Simple working version",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -37,7 +61,13 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint."""
+    """Health check endpoint; probes the database when the pool is up."""
+    if app.state.pool is not None:
+        try:
+            await app.state.pool.fetchval("SELECT 1")
+            return {"status": "healthy", "service": "table-booking-api", "database": "up"}
+        except Exception:
+            return {"status": "healthy", "service": "table-booking-api", "database": "down"}
     return {"status": "healthy", "service": "table-booking-api"}
 
 if __name__ == "__main__":
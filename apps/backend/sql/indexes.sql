@@ -0,0 +1,17 @@
+CREATE INDEX idx_bookings_tn_date ON bookings(table_number, booking_date);
+CREATE INDEX idx_bookings_user_id ON bookings(user_id);
+CREATE INDEX idx_bookings_date ON bookings(booking_date);
+CREATE INDEX idx_table_blocks_table_number ON table_blocks(table_number);
+CREATE INDEX idx_users_username ON users(username);
+CREATE INDEX idx_users_email ON users(email);
+
+-- Hot-path indexes declared on the SQLAlchemy models; keep in step with
+-- app/models.py. ux_booking_slot is the authority on double-booking — a
+-- bootstrapped database without it would accept conflicting confirmed
+-- bookings that the app no longer guards against anywhere else.
+CREATE UNIQUE INDEX ux_booking_slot ON bookings (table_number, booking_date, start_time) WHERE status = 'confirmed';
+CREATE INDEX ix_booking_overlap ON bookings (booking_date, table_number, status, start_time, end_time);
+CREATE INDEX ix_booking_date_user ON bookings (booking_date, user_id);
+CREATE INDEX ix_bookings_date_status ON bookings (booking_date, status);
+CREATE INDEX ix_bookings_source ON bookings (source);
+CREATE INDEX ix_timeslot_active_start ON time_slots (is_active, start_time);
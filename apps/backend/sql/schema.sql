@@ -0,0 +1,109 @@
+DROP TABLE IF EXISTS notifications CASCADE;
+DROP TABLE IF EXISTS table_blocks CASCADE;
+DROP TABLE IF EXISTS bookings CASCADE;
+DROP TABLE IF EXISTS room_layouts CASCADE;
+DROP TABLE IF EXISTS tables CASCADE;
+DROP TABLE IF EXISTS users CASCADE;
+DROP TABLE IF EXISTS time_slots CASCADE;
+DROP TABLE IF EXISTS operating_hours CASCADE;
+DROP TABLE IF EXISTS restaurant_settings CASCADE;
+
+CREATE TABLE restaurant_settings (
+    id SERIAL PRIMARY KEY,
+    restaurant_name VARCHAR(255) NOT NULL DEFAULT 'Restaurant Name',
+    address VARCHAR(500) NOT NULL DEFAULT '123 Main Street, City, State 12345',
+    phone VARCHAR(50),
+    email VARCHAR(255),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE users (
+    id SERIAL PRIMARY KEY,
+    username TEXT UNIQUE NOT NULL,
+    email TEXT UNIQUE NOT NULL,
+    hashed_password TEXT NOT NULL,
+    full_name TEXT NOT NULL,
+    phone TEXT NOT NULL,
+    role TEXT DEFAULT 'system_user',
+    is_active BOOLEAN DEFAULT TRUE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE tables (
+    table_number TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    seats INTEGER NOT NULL,
+    location_x FLOAT NOT NULL,
+    location_y FLOAT NOT NULL,
+    table_type TEXT NOT NULL,
+    is_active BOOLEAN DEFAULT TRUE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE time_slots (
+    id SERIAL PRIMARY KEY,
+    start_time TEXT NOT NULL,
+    end_time TEXT NOT NULL,
+    slot_duration INTEGER NOT NULL,
+    is_active BOOLEAN DEFAULT TRUE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE operating_hours (
+    id SERIAL PRIMARY KEY,
+    day_of_week INTEGER NOT NULL,
+    opening_time TEXT NOT NULL,
+    closing_time TEXT NOT NULL,
+    is_open BOOLEAN DEFAULT TRUE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE bookings (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER NOT NULL REFERENCES users(id) DEFERRABLE INITIALLY DEFERRED,
+    table_number TEXT NOT NULL REFERENCES tables(table_number) DEFERRABLE INITIALLY DEFERRED,
+    booking_date TIMESTAMP NOT NULL,
+    start_time TEXT NOT NULL,
+    end_time TEXT NOT NULL,
+    guest_name TEXT NOT NULL,
+    guest_phone TEXT NOT NULL,
+    number_of_people INTEGER NOT NULL,
+    special_occasion TEXT,
+    status TEXT DEFAULT 'confirmed',
+    source TEXT DEFAULT 'web',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE table_blocks (
+    id SERIAL PRIMARY KEY,
+    table_number TEXT NOT NULL REFERENCES tables(table_number) DEFERRABLE INITIALLY DEFERRED,
+    start_date TIMESTAMP NOT NULL,
+    end_date TIMESTAMP NOT NULL,
+    reason TEXT NOT NULL,
+    created_by INTEGER NOT NULL REFERENCES users(id) DEFERRABLE INITIALLY DEFERRED,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE room_layouts (
+    id SERIAL PRIMARY KEY,
+    name TEXT NOT NULL,
+    layout_data JSON NOT NULL,
+    is_active BOOLEAN DEFAULT TRUE,
+    created_by INTEGER REFERENCES users(id) DEFERRABLE INITIALLY DEFERRED,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE notifications (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER NOT NULL REFERENCES users(id) DEFERRABLE INITIALLY DEFERRED,
+    booking_id INTEGER NOT NULL REFERENCES bookings(id) DEFERRABLE INITIALLY DEFERRED,
+    type TEXT NOT NULL,
+    message TEXT NOT NULL,
+    sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    is_sent BOOLEAN DEFAULT FALSE
+);
@@ -0,0 +1,5 @@
+INSERT INTO restaurant_settings (restaurant_name, address, phone)
+VALUES ('Restaurant Name', '123 Main Street, City, State 12345', '(555) 123-4567');
+
+INSERT INTO users (username, email, hashed_password, full_name, phone, role)
+VALUES ('admin', 'admin@restaurant.com', 'sha256$$6$$rounds=656000$$hash_here', 'Administrator', '555-0001', 'admin');
@@ -5,40 +5,37 @@ Test script to verify all imports work correctly
 import sys
 import os
 
-# Add the current directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Add the current directory to Python path (once; reimports and reloads
+# find it already present and skip the resolve/insert)
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
+
+# (module, label) pairs resolved lazily inside test_imports(); importing
+# this file stays free of the heavy third-party import graph
+CRITICAL_IMPORTS = [
+    ("fastapi", "FastAPI"),
+    ("sqlalchemy", "SQLAlchemy"),
+    ("asyncpg", "asyncpg"),
+    ("app.config", "Config"),
+    ("app.database", "Database"),
+    ("app.models", "Models"),
+    ("app.auth", "Auth"),
+]
 
 def test_imports():
     """Test all critical imports"""
+    import importlib
     try:
         print("Testing imports...")
-        
-        # Test basic packages
-        import fastapi
-        print("✓ FastAPI imported")
-        
-        import sqlalchemy
-        print("✓ SQLAlchemy imported")
-        
-        import asyncpg
-        print("✓ asyncpg imported")
-        
-        # Test app modules
-        from app.config import settings
-        print("✓ Config imported")
-        
-        from app.database import engine, Base
-        print("✓ Database imported")
-        
-        from app.models import User
-        print("✓ Models imported")
-        
-        from app.auth import authenticate_user
-        print("✓ Auth imported")
-        
+
+        for module_name, label in CRITICAL_IMPORTS:
+            importlib.import_module(module_name)
+            print(f"✓ {label} imported")
+
         print("\n🎉 All imports successful!")
         return True
-        
+
     except ImportError as e:
         print(f"❌ Import error: {e}")
         return False